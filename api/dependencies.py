@@ -3,12 +3,18 @@
 FastAPI dependencies for MCP Catalog API
 """
 
-import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional
 
-# Global server registry
-_server_registry: Dict[str, Any] = {}
+import httpx
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Global server registry, loaded on first access
+_server_registry: Optional[Dict[str, Any]] = None
 
 def load_server_registry() -> None:
     """Load the known servers registry"""
@@ -23,8 +29,7 @@ def load_server_registry() -> None:
     
     for registry_path in registry_paths:
         if registry_path.exists():
-            with open(registry_path, 'r') as f:
-                _server_registry = json.load(f)
+            _server_registry = json_loads(registry_path.read_bytes())
             print(f"📚 Loaded {len(_server_registry)} servers from {registry_path}")
             return
     
@@ -32,9 +37,18 @@ def load_server_registry() -> None:
     _server_registry = {}
 
 def get_server_registry() -> Dict[str, Any]:
-    """Get the loaded server registry"""
+    """Get the server registry, loading it on first access"""
+    if _server_registry is None:
+        load_server_registry()
     return _server_registry
 
 def get_server_by_id(server_id: str) -> Dict[str, Any] | None:
     """Get a specific server by ID"""
-    return _server_registry.get(server_id)
\ No newline at end of file
+    return get_server_registry().get(server_id)
+
+async def get_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield a pooled HTTP client for querying MCP servers"""
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    ) as client:
+        yield client
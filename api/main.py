@@ -6,20 +6,10 @@ A modern REST API for MCP server discovery and configuration generation.
 Provides auto-generated OpenAPI specs for gengine-mcp consumption.
 """
 
-from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from .routers import servers, config
-from .dependencies import load_server_registry
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan management"""
-    # Startup
-    load_server_registry()
-    yield
-    # Shutdown (if needed)
 
 # Create FastAPI app with metadata
 app = FastAPI(
@@ -28,8 +18,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json",
-    lifespan=lifespan
+    openapi_url="/openapi.json"
 )
 
 # Configure CORS
@@ -56,18 +45,20 @@ async def root():
         "openapi": "/openapi.json"
     }
 
+# Static part of the health response; only server_count changes per request
+_HEALTH_BASE = {
+    "status": "healthy",
+    "server_count": 0,
+    "catalog_version": "1.0.0",
+    "api_version": "v1"
+}
+
 @app.get("/health", response_model=dict)
 async def health_check():
     """Health check endpoint"""
     from .dependencies import get_server_registry
-    registry = get_server_registry()
     
-    return {
-        "status": "healthy",
-        "server_count": len(registry),
-        "catalog_version": "1.0.0",
-        "api_version": "v1"
-    }
+    return {**_HEALTH_BASE, "server_count": len(get_server_registry())}
 
 if __name__ == "__main__":
     import uvicorn
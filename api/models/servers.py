@@ -4,7 +4,7 @@ Pydantic models for MCP server catalog endpoints
 """
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class ServerSummary(BaseModel):
     """Summary information for a server in listings"""
@@ -77,6 +77,14 @@ class ConfigValidationRequest(BaseModel):
     """Request for validating configuration"""
     config: Dict[str, Any] = Field(..., description="Configuration to validate")
 
+class ServerConfigShape(BaseModel):
+    """Structural shape of a single MCP server configuration"""
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    command: Any = Field(..., description="Command to run the server")
+    args: List[Any] = Field(default_factory=list, description="Command arguments")
+    env: Dict[Any, Any] = Field(default_factory=dict, description="Environment variables")
+
 class ConfigValidationResponse(BaseModel):
     """Response for configuration validation"""
     valid: bool = Field(..., description="Whether configuration is valid")
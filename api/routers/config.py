@@ -4,63 +4,88 @@ FastAPI router for configuration management endpoints
 """
 
 from fastapi import APIRouter, HTTPException
-from typing import Dict, List
+from pydantic import ValidationError
+from typing import Any, Dict, List
 
 from ..models.servers import (
     ConfigGenerationRequest, ConfigGenerationResponse, 
     ConfigValidationRequest, ConfigValidationResponse,
-    MCPServerConfig
+    MCPServerConfig, ServerConfigShape
 )
-from ..dependencies import get_server_registry, get_server_by_id
+from ..dependencies import get_server_registry
 
 router = APIRouter()
 
+# Error message for each top-level field that fails structural validation
+_SHAPE_ERRORS = {
+    "command": "Missing required field: 'command'",
+    "args": "Field 'args' must be an array",
+    "env": "Field 'env' must be an object",
+}
+
+# Commands the validator accepts without an "unusual command" warning
+_KNOWN_COMMANDS = frozenset({"npx", "node", "python", "docker", "deno", "bun"})
+
+def _shape_errors(config: Dict[str, Any]) -> List[str]:
+    """Check required fields and container types in one compiled validation pass"""
+    try:
+        ServerConfigShape.model_validate(config)
+    except ValidationError as e:
+        return [_SHAPE_ERRORS[error["loc"][0]] for error in e.errors()]
+    return []
+
+def _build_server_config(server_id: str, server_config: Dict[str, Any],
+                         request: ConfigGenerationRequest) -> Dict[str, Any]:
+    """Build the mcpServers entry for one registry server"""
+    # Get installation command based on format
+    installation = server_config.get("installation") or {}
+    command_info = installation.get("command")
+    env_spec = (server_config.get("config") or {}).get("env")
+    
+    if request.format == "docker" and "docker" in installation:
+        mcp_config = MCPServerConfig(
+            command="docker",
+            args=["run", "-i", "--rm", f"mcp/{server_id}"]
+        )
+    elif command_info:
+        mcp_config = MCPServerConfig(
+            command=command_info["command"],
+            args=command_info.get("args", [])
+        )
+    else:
+        # Default NPX installation
+        mcp_config = MCPServerConfig(
+            command="npx",
+            args=["-y", f"@modelcontextprotocol/server-{server_id}"]
+        )
+    
+    # Add environment variables if requested
+    if request.include_env_vars and env_spec:
+        env_config = {
+            env_var: f"${{{env_var}}}"
+            for env_var, env_config_item in env_spec.items()
+            if env_config_item.get("required")
+        }
+        if env_config:
+            mcp_config.env = env_config
+    
+    return mcp_config.model_dump(exclude_none=True)
+
 @router.post("/servers/generate-config", response_model=ConfigGenerationResponse)
 async def generate_mcp_config(request: ConfigGenerationRequest):
     """Generate MCP configuration for specified servers"""
-    registry = get_server_registry()
-    
     if not request.servers:
         raise HTTPException(status_code=400, detail="No servers specified")
     
-    # Generate configuration
-    config = {"mcpServers": {}}
+    registry = get_server_registry()
     
-    for server_id in request.servers:
-        server_config = get_server_by_id(server_id)
-        if not server_config:
-            continue  # Skip unknown servers
-        
-        # Get installation command based on format
-        installation = server_config.get("installation", {})
-        if request.format == "docker" and "docker" in installation:
-            mcp_config = MCPServerConfig(
-                command="docker",
-                args=["run", "-i", "--rm", f"mcp/{server_id}"]
-            )
-        elif "command" in installation:
-            command_info = installation["command"]
-            mcp_config = MCPServerConfig(
-                command=command_info["command"],
-                args=command_info.get("args", [])
-            )
-        else:
-            # Default NPX installation
-            mcp_config = MCPServerConfig(
-                command="npx",
-                args=["-y", f"@modelcontextprotocol/server-{server_id}"]
-            )
-        
-        # Add environment variables if requested
-        if request.include_env_vars and "env" in server_config.get("config", {}):
-            env_config = {}
-            for env_var, env_config_item in server_config["config"]["env"].items():
-                if env_config_item.get("required"):
-                    env_config[env_var] = f"${{{env_var}}}"
-            if env_config:
-                mcp_config.env = env_config
-        
-        config["mcpServers"][server_id] = mcp_config.model_dump(exclude_none=True)
+    # Generate configuration from a single registry lookup per server,
+    # skipping unknown servers
+    config = {"mcpServers": {
+        server_id: _build_server_config(server_id, server_config, request)
+        for server_id in request.servers
+        if (server_config := registry.get(server_id))
+    }}
     
     return ConfigGenerationResponse(
         format=request.format,
@@ -74,33 +99,23 @@ async def validate_server_config(request: ConfigValidationRequest):
     """Validate an MCP server configuration"""
     config = request.config
     
-    # Basic validation
-    errors = []
+    # Required fields and container types
+    errors = _shape_errors(config)
     warnings = []
     
-    # Check for required fields
-    if "command" not in config:
-        errors.append("Missing required field: 'command'")
-    
     # Check command type
     command = config.get("command", "")
-    if command not in ["npx", "node", "python", "docker", "deno", "bun"]:
+    # Non-string commands are unhashable or never known, so only strings hit the set
+    if not (isinstance(command, str) and command in _KNOWN_COMMANDS):
         warnings.append(f"Unusual command: '{command}'")
     
-    # Check args
-    if "args" in config and not isinstance(config["args"], list):
-        errors.append("Field 'args' must be an array")
-    
-    # Check env
-    if "env" in config:
-        if not isinstance(config["env"], dict):
-            errors.append("Field 'env' must be an object")
-        else:
-            for key, value in config["env"].items():
-                if not isinstance(key, str):
-                    errors.append(f"Environment variable key must be string: {key}")
-                if not isinstance(value, str):
-                    warnings.append(f"Environment variable '{key}' value should be string")
+    # Check env entries
+    if isinstance(config.get("env"), dict):
+        for key, value in config["env"].items():
+            if not isinstance(key, str):
+                errors.append(f"Environment variable key must be string: {key}")
+            if not isinstance(value, str):
+                warnings.append(f"Environment variable '{key}' value should be string")
     
     is_valid = len(errors) == 0
     
@@ -3,27 +3,52 @@
 FastAPI router for server management endpoints
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+import os
 import sys
-from pathlib import Path
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
 
 from ..models.servers import (
     ServerListResponse, ServerDetails, SearchResponse, 
     CategoriesResponse, CategoryInfo, ServerSummary,
     ServersToolsResponse, ServerWithTools, ServerTool
 )
-from ..dependencies import get_server_registry, get_server_by_id
+from ..dependencies import get_server_registry, get_server_by_id, get_http_client
+
+def _find_engine_subprocess_manager():
+    """Return the engine's get_subprocess_manager, or None if it can't be loaded
+    
+    Uses an installed `subprocess_manager` first. Otherwise MCP_ENGINE_ROOT
+    names the engine checkout, which is appended to the import path so the
+    module and its sibling modules import normally.
+    """
+    engine_root = os.getenv("MCP_ENGINE_ROOT")
+    if engine_root and engine_root not in sys.path:
+        # Appended, so installed packages still take precedence
+        sys.path.append(engine_root)
+    
+    try:
+        from subprocess_manager import get_subprocess_manager
+    except (ImportError, AttributeError) as e:
+        # A missing module, a failing engine import or no get_subprocess_manager
+        if engine_root:
+            print(f"⚠️  Could not load subprocess_manager from MCP_ENGINE_ROOT={engine_root}: {e}")
+        return None
+    
+    return get_subprocess_manager
 
-# Add engine root directory to path to import subprocess_manager
-engine_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(engine_root))
+# subprocess_manager is provided by the engine, not by this package
+_engine_get_subprocess_manager = _find_engine_subprocess_manager()
 
-try:
-    from subprocess_manager import get_subprocess_manager
-except ImportError:
+if _engine_get_subprocess_manager is not None:
+    get_subprocess_manager = _engine_get_subprocess_manager
+else:
     # For testing or when subprocess_manager isn't available
     def get_subprocess_manager():
+        print("⚠️  subprocess_manager not found (install the engine or set MCP_ENGINE_ROOT); "
+              "stdio servers will report no tools")
         from unittest.mock import MagicMock, AsyncMock
         mock = MagicMock()
         mock.processes = {}
@@ -67,24 +92,23 @@ async def search_servers(
     registry = get_server_registry()
     results = []
     
-    for server_id, server_config in registry.items():
-        # Check if matches query
-        matches_query = True
-        if q:
-            q_lower = q.lower()
-            matches_query = (
-                q_lower in server_id.lower() or
-                q_lower in server_config.get("name", "").lower() or
-                q_lower in server_config.get("description", "").lower()
-            )
-        
-        # Check category filter
-        matches_category = (
-            category is None or 
-            server_config.get("category", "other") == category
+    # Normalize the filters once rather than per server
+    q_lower = q.lower() if q else None
+    
+    def matches(server_id: str, server_config: dict) -> bool:
+        # Cheap category equality first, then the substring scans
+        if category is not None and server_config.get("category", "other") != category:
+            return False
+        if q_lower is None:
+            return True
+        return (
+            q_lower in server_id.lower() or
+            q_lower in server_config.get("name", "").lower() or
+            q_lower in server_config.get("description", "").lower()
         )
-        
-        if matches_query and matches_category:
+    
+    for server_id, server_config in registry.items():
+        if matches(server_id, server_config):
             results.append(ServerSummary(
                 id=server_id,
                 name=server_config.get("name", server_id),
@@ -101,11 +125,9 @@ async def search_servers(
     )
 
 @router.get("/servers/tools", response_model=ServersToolsResponse)
-async def get_servers_with_tools():
+async def get_servers_with_tools(http_client: httpx.AsyncClient = Depends(get_http_client)):
     """Get all servers with their available tools by dynamically querying each MCP server"""
-    import httpx
     import asyncio
-    import os
     
     registry = get_server_registry()
     servers_with_tools = []
@@ -119,22 +141,21 @@ async def get_servers_with_tools():
         tools = []
         
         try:
-            async with httpx.AsyncClient() as client:
-                # Standard MCP tools listing endpoint
-                response = await client.post(
-                    f"{mcp_url}/mcp/v1/list_tools",
-                    json={},
-                    timeout=5.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    for tool in result.get("tools", []):
-                        tools.append(ServerTool(
-                            name=tool.get("name", ""),
-                            description=tool.get("description", ""),
-                            parameters=tool.get("inputSchema", {})
-                        ))
+            # Standard MCP tools listing endpoint
+            response = await http_client.post(
+                f"{mcp_url}/mcp/v1/list_tools",
+                json={},
+                timeout=5.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                for tool in result.get("tools", []):
+                    tools.append(ServerTool(
+                        name=tool.get("name", ""),
+                        description=tool.get("description", ""),
+                        parameters=tool.get("inputSchema", {})
+                    ))
         except Exception as e:
             print(f"Could not query HTTP tools for {server_id}: {e}")
             
@@ -147,11 +168,10 @@ async def get_servers_with_tools():
         try:
             # Check if server has required environment variables
             env_vars = server_config.get("environment", {})
-            missing_vars = []
-            
-            for var_name, var_config in env_vars.items():
-                if var_config.get("required", False) and not os.getenv(var_name):
-                    missing_vars.append(var_name)
+            missing_vars = [
+                var_name for var_name, var_config in env_vars.items()
+                if var_config.get("required", False) and not os.getenv(var_name)
+            ]
             
             if missing_vars:
                 print(f"Server {server_id} missing required env vars: {missing_vars}")
@@ -212,15 +232,20 @@ async def get_servers_with_tools():
         print(f"Unknown transport type for {server_id}: {transport}")
         return []
     
-    # Query all servers in parallel
-    tasks = []
-    for server_id, server_config in registry.items():
-        task = query_mcp_server_tools(server_id, server_config)
-        tasks.append((server_id, server_config, task))
+    # Query all servers in parallel, always cleaning up started subprocesses
+    try:
+        results = await asyncio.gather(*(
+            query_mcp_server_tools(server_id, server_config)
+            for server_id, server_config in registry.items()
+        ), return_exceptions=True)
+    finally:
+        await subprocess_manager.cleanup()
     
     # Gather results
-    for server_id, server_config, task in tasks:
-        tools = await task
+    for (server_id, server_config), tools in zip(registry.items(), results):
+        if isinstance(tools, Exception):
+            print(f"Could not query tools for {server_id}: {tools}")
+            tools = []
         tool_count = len(tools)
         total_tools += tool_count
         
@@ -232,9 +257,6 @@ async def get_servers_with_tools():
             tool_count=tool_count
         ))
     
-    # Clean up subprocess manager
-    await subprocess_manager.cleanup()
-    
     return ServersToolsResponse(
         servers=servers_with_tools,
         total_servers=len(servers_with_tools),
@@ -5,101 +5,153 @@ This provides MCP protocol access to the MCP Catalog REST API
 """
 
 import os
+import re
+from functools import cache
 import httpx
 from fastmcp import FastMCP
 from fastmcp.server.openapi import RouteMap, MCPType
 
-# Create HTTP client for the REST API
-client = httpx.AsyncClient(
-    base_url=os.getenv("MCP_CATALOG_API_URL", "http://localhost:8000"),
-    timeout=30.0
-)
-
-# Fetch OpenAPI spec
-response = httpx.get(f"{client.base_url}/openapi.json")
-openapi_spec = response.json()
-
-# Create FastMCP server from OpenAPI
-mcp = FastMCP.from_openapi(
-    openapi_spec=openapi_spec,
-    client=client,
-    name="MCP Catalog",
-    instructions="""
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Route patterns, compiled once and handed to RouteMap as Pattern objects
+SERVERS_PATTERN = re.compile(r"^/api/v1/servers$")
+CATEGORIES_PATTERN = re.compile(r"^/api/v1/categories$")
+PATH_PARAM_PATTERN = re.compile(r".*\{.*\}.*")
+SEARCH_PATTERN = re.compile(r"^/api/v1/servers/search$")
+ANY_PATTERN = re.compile(r".*")
+HEALTH_PATTERN = re.compile(r"^/health$")
+
+INSTRUCTIONS = """
     MCP Catalog - Configuration Oracle
-    
+
     This server provides access to the MCP server catalog through the MCP protocol.
     Use it to discover, configure, and validate MCP servers for your projects.
-    
+
     Available operations:
     - List all available MCP servers
     - Get detailed information about specific servers
     - Search servers by name or category
     - Generate MCP configurations for Claude Desktop or other clients
     - Validate MCP server configurations
-    """,
-    route_maps=[
-        # GET endpoints that list data become Resources
-        RouteMap(
-            methods=["GET"], 
-            pattern=r"^/api/v1/servers$", 
-            mcp_type=MCPType.RESOURCE,
-            mcp_tags={"catalog", "list"}
-        ),
-        RouteMap(
-            methods=["GET"], 
-            pattern=r"^/api/v1/categories$", 
-            mcp_type=MCPType.RESOURCE,
-            mcp_tags={"catalog", "metadata"}
-        ),
-        
-        # GET endpoints with parameters become ResourceTemplates
-        RouteMap(
-            methods=["GET"], 
-            pattern=r".*\{.*\}.*", 
-            mcp_type=MCPType.RESOURCE_TEMPLATE,
-            mcp_tags={"catalog", "detail"}
-        ),
-        
-        # Search endpoint becomes a Tool (it has query params)
-        RouteMap(
-            methods=["GET"],
-            pattern=r"^/api/v1/servers/search$",
-            mcp_type=MCPType.TOOL,
-            mcp_tags={"catalog", "search"}
-        ),
-        
-        # All POST endpoints become Tools
-        RouteMap(
-            methods=["POST"], 
-            pattern=r".*", 
-            mcp_type=MCPType.TOOL,
-            mcp_tags={"catalog", "action"}
-        ),
-        
-        # Health check is a simple Resource
-        RouteMap(
-            methods=["GET"],
-            pattern=r"^/health$",
-            mcp_type=MCPType.RESOURCE,
-            mcp_tags={"system", "health"}
-        )
-    ]
-)
+    """
+
+ROUTE_MAPS = [
+    # GET endpoints that list data become Resources
+    RouteMap(
+        methods=["GET"],
+        pattern=SERVERS_PATTERN,
+        mcp_type=MCPType.RESOURCE,
+        mcp_tags={"catalog", "list"}
+    ),
+    RouteMap(
+        methods=["GET"],
+        pattern=CATEGORIES_PATTERN,
+        mcp_type=MCPType.RESOURCE,
+        mcp_tags={"catalog", "metadata"}
+    ),
+
+    # GET endpoints with parameters become ResourceTemplates
+    RouteMap(
+        methods=["GET"],
+        pattern=PATH_PARAM_PATTERN,
+        mcp_type=MCPType.RESOURCE_TEMPLATE,
+        mcp_tags={"catalog", "detail"}
+    ),
+
+    # Search endpoint becomes a Tool (it has query params)
+    RouteMap(
+        methods=["GET"],
+        pattern=SEARCH_PATTERN,
+        mcp_type=MCPType.TOOL,
+        mcp_tags={"catalog", "search"}
+    ),
+
+    # All POST endpoints become Tools
+    RouteMap(
+        methods=["POST"],
+        pattern=ANY_PATTERN,
+        mcp_type=MCPType.TOOL,
+        mcp_tags={"catalog", "action"}
+    ),
+
+    # Health check is a simple Resource
+    RouteMap(
+        methods=["GET"],
+        pattern=HEALTH_PATTERN,
+        mcp_type=MCPType.RESOURCE,
+        mcp_tags={"system", "health"}
+    )
+]
+
+def create_server() -> FastMCP:
+    """Fetch the catalog's OpenAPI spec and build the FastMCP server from it"""
+    # Create HTTP client for the REST API
+    client = httpx.AsyncClient(
+        base_url=os.getenv("MCP_CATALOG_API_URL", "http://localhost:8000"),
+        timeout=30.0
+    )
+
+    # Fetch OpenAPI spec
+    response = httpx.get(f"{client.base_url}/openapi.json")
+    openapi_spec = json_loads(response.content)
+
+    # Create FastMCP server from OpenAPI
+    return FastMCP.from_openapi(
+        openapi_spec=openapi_spec,
+        client=client,
+        name="MCP Catalog",
+        instructions=INSTRUCTIONS,
+        route_maps=ROUTE_MAPS
+    )
+
+@cache
+def _default_server() -> FastMCP:
+    """Build the server once for attribute access"""
+    return create_server()
+
+def __getattr__(name: str):
+    """Build `mcp` on first access, so `fastmcp run <this file>` still finds the server"""
+    if name == "mcp":
+        return _default_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     import argparse
-    
+    import sys
+    from functools import partial
+
+    import anyio
+
     parser = argparse.ArgumentParser(description="MCP Catalog Server (via FastMCP)")
     parser.add_argument("--transport", choices=["stdio", "http"], default="stdio",
                        help="Transport protocol (default: stdio)")
     parser.add_argument("--port", type=int, default=8001,
                        help="Port for HTTP transport (default: 8001)")
-    
+
     args = parser.parse_args()
-    
+
+    # uvloop ships with uvicorn[standard] on non-Windows platforms. Its loop
+    # factory goes to anyio directly: uvloop.install() and the event loop
+    # policy API behind it are deprecated from Python 3.12 on.
+    backend_options = {}
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            backend_options["loop_factory"] = uvloop.new_event_loop
+        except ImportError:
+            pass
+
+    mcp = create_server()
+
+    # FastMCP.run() takes no anyio backend options, so drive run_async here
     if args.transport == "http":
         print(f"🚀 Starting MCP Catalog server on http://localhost:{args.port}/mcp")
-        mcp.run(transport="http", port=args.port)
+        serve = partial(mcp.run_async, transport="http", port=args.port)
     else:
         print("📡 Starting MCP Catalog server with stdio transport")
-        mcp.run(transport="stdio")
+        serve = partial(mcp.run_async, transport="stdio")
+
+    anyio.run(serve, backend_options=backend_options)
@@ -5,21 +5,16 @@ Unit tests for api_server.py
 
 import json
 import pytest
-import sys
 from pathlib import Path
 
-# Add the framework directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "framework" / "generators"))
+# api_server is provided by the installed framework generators package
+pytest.importorskip("api_server", reason="api_server module not available")
+from api_server import app, load_server_registry, _server_registry
 
-try:
-    from api_server import app, load_server_registry, _server_registry
-except ImportError:
-    pytest.skip("api_server module not available", allow_module_level=True)
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client"""
+    """Create a test client shared across the session"""
     app.config['TESTING'] = True
     with app.test_client() as client:
         yield client
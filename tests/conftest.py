@@ -3,14 +3,46 @@
 Pytest configuration and fixtures for gengine-mcp-catalog tests
 """
 
+import httpx
 import pytest
+from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
+from api.dependencies import get_http_client
 from api.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def client():
-    """Create async test client"""
+    """Create an async test client shared across the session"""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
\ No newline at end of file
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def sync_client():
+    """Create a synchronous test client shared across the session"""
+    with TestClient(app) as tc:
+        yield tc
+
+
+def _install_mcp_http_handler(handler):
+    """Route the get_http_client dependency through an httpx.MockTransport handler"""
+    async def override():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+            yield http_client
+    app.dependency_overrides[get_http_client] = override
+
+
+@pytest.fixture
+def mock_mcp_http():
+    """Answer the tools endpoint's outbound MCP calls with an httpx.MockTransport handler"""
+    yield _install_mcp_http_handler
+    app.dependency_overrides.pop(get_http_client, None)
+
+
+@pytest.fixture(scope="module")
+def module_mock_mcp_http():
+    """Module-scoped mock_mcp_http, for fixtures that share one response across a module"""
+    yield _install_mcp_http_handler
+    app.dependency_overrides.pop(get_http_client, None)
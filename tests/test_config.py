@@ -4,19 +4,8 @@ Tests for configuration router endpoints
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch
 
-from api.main import app
-
-@pytest.fixture
-def client():
-    """Create test client"""
-    # Manually trigger startup to load registry
-    from api.dependencies import load_server_registry
-    load_server_registry()
-    return TestClient(app)
-
 @pytest.fixture
 def mock_registry():
     """Mock server registry for testing"""
@@ -70,11 +59,9 @@ class TestConfigEndpoints:
     """Test configuration management endpoints"""
     
     @patch('api.routers.config.get_server_registry')
-    @patch('api.routers.config.get_server_by_id')
-    def test_generate_config_simple(self, mock_get_server, mock_get_registry, client, mock_registry):
+    def test_generate_config_simple(self, mock_get_registry, sync_client, mock_registry):
         """Test basic config generation"""
         mock_get_registry.return_value = mock_registry
-        mock_get_server.side_effect = lambda server_id: mock_registry.get(server_id)
         
         request_data = {
             "servers": ["github"],
@@ -82,7 +69,7 @@ class TestConfigEndpoints:
             "include_env_vars": False
         }
         
-        response = client.post("/api/v1/servers/generate-config", json=request_data)
+        response = sync_client.post("/api/v1/servers/generate-config", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -101,11 +88,9 @@ class TestConfigEndpoints:
         assert "installation_notes" in data
     
     @patch('api.routers.config.get_server_registry')
-    @patch('api.routers.config.get_server_by_id')
-    def test_generate_config_with_env_vars(self, mock_get_server, mock_get_registry, client, mock_registry):
+    def test_generate_config_with_env_vars(self, mock_get_registry, sync_client, mock_registry):
         """Test config generation including environment variables"""
         mock_get_registry.return_value = mock_registry
-        mock_get_server.side_effect = lambda server_id: mock_registry.get(server_id)
         
         request_data = {
             "servers": ["github"],
@@ -113,7 +98,7 @@ class TestConfigEndpoints:
             "include_env_vars": True
         }
         
-        response = client.post("/api/v1/servers/generate-config", json=request_data)
+        response = sync_client.post("/api/v1/servers/generate-config", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -125,11 +110,9 @@ class TestConfigEndpoints:
         assert github_config["env"]["GITHUB_TOKEN"] == "${GITHUB_TOKEN}"
     
     @patch('api.routers.config.get_server_registry')
-    @patch('api.routers.config.get_server_by_id')
-    def test_generate_config_docker_format(self, mock_get_server, mock_get_registry, client, mock_registry):
+    def test_generate_config_docker_format(self, mock_get_registry, sync_client, mock_registry):
         """Test config generation with Docker format"""
         mock_get_registry.return_value = mock_registry
-        mock_get_server.side_effect = lambda server_id: mock_registry.get(server_id)
         
         request_data = {
             "servers": ["github"],
@@ -137,7 +120,7 @@ class TestConfigEndpoints:
             "include_env_vars": False
         }
         
-        response = client.post("/api/v1/servers/generate-config", json=request_data)
+        response = sync_client.post("/api/v1/servers/generate-config", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -151,11 +134,9 @@ class TestConfigEndpoints:
         assert "mcp/github" in github_config["args"]
     
     @patch('api.routers.config.get_server_registry')
-    @patch('api.routers.config.get_server_by_id')
-    def test_generate_config_multiple_servers(self, mock_get_server, mock_get_registry, client, mock_registry):
+    def test_generate_config_multiple_servers(self, mock_get_registry, sync_client, mock_registry):
         """Test config generation for multiple servers"""
         mock_get_registry.return_value = mock_registry
-        mock_get_server.side_effect = lambda server_id: mock_registry.get(server_id)
         
         request_data = {
             "servers": ["github", "filesystem"],
@@ -163,7 +144,7 @@ class TestConfigEndpoints:
             "include_env_vars": True
         }
         
-        response = client.post("/api/v1/servers/generate-config", json=request_data)
+        response = sync_client.post("/api/v1/servers/generate-config", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -181,7 +162,7 @@ class TestConfigEndpoints:
         assert "-m" in config["filesystem"]["args"]
         assert "filesystem_server" in config["filesystem"]["args"]
     
-    def test_generate_config_no_servers(self, client):
+    def test_generate_config_no_servers(self, sync_client):
         """Test config generation with no servers specified"""
         request_data = {
             "servers": [],
@@ -189,16 +170,14 @@ class TestConfigEndpoints:
             "include_env_vars": False
         }
         
-        response = client.post("/api/v1/servers/generate-config", json=request_data)
+        response = sync_client.post("/api/v1/servers/generate-config", json=request_data)
         assert response.status_code == 400
         assert "no servers specified" in response.json()["detail"].lower()
     
     @patch('api.routers.config.get_server_registry')
-    @patch('api.routers.config.get_server_by_id')
-    def test_generate_config_unknown_server(self, mock_get_server, mock_get_registry, client, mock_registry):
+    def test_generate_config_unknown_server(self, mock_get_registry, sync_client, mock_registry):
         """Test config generation with unknown server (should skip)"""
         mock_get_registry.return_value = mock_registry
-        mock_get_server.side_effect = lambda server_id: mock_registry.get(server_id)
         
         request_data = {
             "servers": ["github", "nonexistent"],
@@ -206,7 +185,7 @@ class TestConfigEndpoints:
             "include_env_vars": False
         }
         
-        response = client.post("/api/v1/servers/generate-config", json=request_data)
+        response = sync_client.post("/api/v1/servers/generate-config", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -220,7 +199,7 @@ class TestConfigEndpoints:
 class TestConfigValidation:
     """Test configuration validation endpoints"""
     
-    def test_validate_valid_config(self, client):
+    def test_validate_valid_config(self, sync_client):
         """Test validation of a valid configuration"""
         config_data = {
             "config": {
@@ -232,7 +211,7 @@ class TestConfigValidation:
             }
         }
         
-        response = client.post("/api/v1/servers/validate-config", json=config_data)
+        response = sync_client.post("/api/v1/servers/validate-config", json=config_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -240,7 +219,7 @@ class TestConfigValidation:
         assert len(data["errors"]) == 0
         assert data["config"] == config_data["config"]
     
-    def test_validate_config_missing_command(self, client):
+    def test_validate_config_missing_command(self, sync_client):
         """Test validation with missing command field"""
         config_data = {
             "config": {
@@ -248,7 +227,7 @@ class TestConfigValidation:
             }
         }
         
-        response = client.post("/api/v1/servers/validate-config", json=config_data)
+        response = sync_client.post("/api/v1/servers/validate-config", json=config_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -256,7 +235,7 @@ class TestConfigValidation:
         assert len(data["errors"]) > 0
         assert any("command" in error.lower() for error in data["errors"])
     
-    def test_validate_config_unusual_command(self, client):
+    def test_validate_config_unusual_command(self, sync_client):
         """Test validation with unusual command (should warn)"""
         config_data = {
             "config": {
@@ -265,7 +244,7 @@ class TestConfigValidation:
             }
         }
         
-        response = client.post("/api/v1/servers/validate-config", json=config_data)
+        response = sync_client.post("/api/v1/servers/validate-config", json=config_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -273,7 +252,7 @@ class TestConfigValidation:
         assert len(data["warnings"]) > 0
         assert any("unusual command" in warning.lower() for warning in data["warnings"])
     
-    def test_validate_config_invalid_args_type(self, client):
+    def test_validate_config_invalid_args_type(self, sync_client):
         """Test validation with invalid args type"""
         config_data = {
             "config": {
@@ -282,14 +261,14 @@ class TestConfigValidation:
             }
         }
         
-        response = client.post("/api/v1/servers/validate-config", json=config_data)
+        response = sync_client.post("/api/v1/servers/validate-config", json=config_data)
         assert response.status_code == 200
         
         data = response.json()
         assert data["valid"] is False
         assert any("args" in error.lower() and "array" in error.lower() for error in data["errors"])
     
-    def test_validate_config_invalid_env_type(self, client):
+    def test_validate_config_invalid_env_type(self, sync_client):
         """Test validation with invalid env type"""
         config_data = {
             "config": {
@@ -298,14 +277,14 @@ class TestConfigValidation:
             }
         }
         
-        response = client.post("/api/v1/servers/validate-config", json=config_data)
+        response = sync_client.post("/api/v1/servers/validate-config", json=config_data)
         assert response.status_code == 200
         
         data = response.json()
         assert data["valid"] is False
         assert any("env" in error.lower() and "object" in error.lower() for error in data["errors"])
     
-    def test_validate_config_non_string_env_values(self, client):
+    def test_validate_config_non_string_env_values(self, sync_client):
         """Test validation with non-string environment values"""
         config_data = {
             "config": {
@@ -317,7 +296,7 @@ class TestConfigValidation:
             }
         }
         
-        response = client.post("/api/v1/servers/validate-config", json=config_data)
+        response = sync_client.post("/api/v1/servers/validate-config", json=config_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -4,20 +4,19 @@ Test configuration endpoints (/api/v1/servers/generate-config and /api/v1/server
 """
 
 import pytest
-from unittest.mock import patch
-from httpx import AsyncClient
+from types import MappingProxyType
+from fastapi.testclient import TestClient
 
 from api.models.servers import ConfigGenerationRequest, ConfigValidationRequest
 
 
-@pytest.mark.asyncio
 class TestConfigEndpoints:
     """Test configuration generation and validation endpoints"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_registry(self):
-        """Mock server registry with test servers"""
-        return {
+        """Read-only mock server registry, built once per module"""
+        return MappingProxyType({
             "github": {
                 "id": "github",
                 "name": "GitHub MCP",
@@ -53,81 +52,73 @@ class TestConfigEndpoints:
                 "description": "Weather data",
                 # No installation config - should default to NPX
             }
-        }
+        })
     
-    @pytest.mark.asyncio
-    async def test_generate_config_success(self, client: AsyncClient, mock_registry):
+    @pytest.fixture(autouse=True)
+    def _patch_registry(self, monkeypatch, mock_registry):
+        """Serve the mock registry to the config router for every test"""
+        monkeypatch.setattr("api.routers.config.get_server_registry", lambda: mock_registry)
+    
+    def test_generate_config_success(self, sync_client: TestClient):
         """Test successful configuration generation"""
-        with patch("api.routers.config.get_server_registry", return_value=mock_registry), \
-             patch("api.routers.config.get_server_by_id", side_effect=lambda x: mock_registry.get(x)):
-            
-            # Test basic config generation
-            response = await client.post("/api/v1/servers/generate-config", json={
-                "servers": ["github", "filesystem"],
-                "format": "claude_desktop",
-                "include_env_vars": True
-            })
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            assert data["format"] == "claude_desktop"
-            assert "config" in data
-            assert "mcpServers" in data["config"]
-            assert len(data["servers_included"]) == 2
-            assert "github" in data["config"]["mcpServers"]
-            assert "filesystem" in data["config"]["mcpServers"]
-            
-            # Check GitHub config
-            github_config = data["config"]["mcpServers"]["github"]
-            assert github_config["command"] == "npx"
-            assert github_config["args"] == ["-y", "@modelcontextprotocol/server-github"]
-            assert "env" in github_config
-            assert "GITHUB_PERSONAL_ACCESS_TOKEN" in github_config["env"]
+        # Test basic config generation
+        response = sync_client.post("/api/v1/servers/generate-config", json={
+            "servers": ["github", "filesystem"],
+            "format": "claude_desktop",
+            "include_env_vars": True
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["format"] == "claude_desktop"
+        assert "config" in data
+        assert "mcpServers" in data["config"]
+        assert len(data["servers_included"]) == 2
+        assert "github" in data["config"]["mcpServers"]
+        assert "filesystem" in data["config"]["mcpServers"]
+        
+        # Check GitHub config
+        github_config = data["config"]["mcpServers"]["github"]
+        assert github_config["command"] == "npx"
+        assert github_config["args"] == ["-y", "@modelcontextprotocol/server-github"]
+        assert "env" in github_config
+        assert "GITHUB_PERSONAL_ACCESS_TOKEN" in github_config["env"]
     
-    @pytest.mark.asyncio
-    async def test_generate_config_docker_format(self, client: AsyncClient, mock_registry):
+    def test_generate_config_docker_format(self, sync_client: TestClient):
         """Test Docker format configuration generation"""
-        with patch("api.routers.config.get_server_registry", return_value=mock_registry), \
-             patch("api.routers.config.get_server_by_id", side_effect=lambda x: mock_registry.get(x)):
-            
-            response = await client.post("/api/v1/servers/generate-config", json={
-                "servers": ["filesystem"],
-                "format": "docker",
-                "include_env_vars": False
-            })
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            filesystem_config = data["config"]["mcpServers"]["filesystem"]
-            assert filesystem_config["command"] == "docker"
-            assert "run" in filesystem_config["args"]
-            assert "mcp/filesystem" in filesystem_config["args"]
+        response = sync_client.post("/api/v1/servers/generate-config", json={
+            "servers": ["filesystem"],
+            "format": "docker",
+            "include_env_vars": False
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        filesystem_config = data["config"]["mcpServers"]["filesystem"]
+        assert filesystem_config["command"] == "docker"
+        assert "run" in filesystem_config["args"]
+        assert "mcp/filesystem" in filesystem_config["args"]
     
-    @pytest.mark.asyncio
-    async def test_generate_config_default_npx(self, client: AsyncClient, mock_registry):
+    def test_generate_config_default_npx(self, sync_client: TestClient):
         """Test default NPX configuration for servers without installation config"""
-        with patch("api.routers.config.get_server_registry", return_value=mock_registry), \
-             patch("api.routers.config.get_server_by_id", side_effect=lambda x: mock_registry.get(x)):
-            
-            response = await client.post("/api/v1/servers/generate-config", json={
-                "servers": ["weather"],
-                "format": "claude_desktop",
-                "include_env_vars": False
-            })
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            weather_config = data["config"]["mcpServers"]["weather"]
-            assert weather_config["command"] == "npx"
-            assert weather_config["args"] == ["-y", "@modelcontextprotocol/server-weather"]
+        response = sync_client.post("/api/v1/servers/generate-config", json={
+            "servers": ["weather"],
+            "format": "claude_desktop",
+            "include_env_vars": False
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        weather_config = data["config"]["mcpServers"]["weather"]
+        assert weather_config["command"] == "npx"
+        assert weather_config["args"] == ["-y", "@modelcontextprotocol/server-weather"]
     
-    @pytest.mark.asyncio
-    async def test_generate_config_no_servers(self, client: AsyncClient):
+    def test_generate_config_no_servers(self, sync_client: TestClient):
         """Test config generation with empty server list"""
-        response = await client.post("/api/v1/servers/generate-config", json={
+        response = sync_client.post("/api/v1/servers/generate-config", json={
             "servers": [],
             "format": "claude_desktop"
         })
@@ -135,29 +126,24 @@ class TestConfigEndpoints:
         assert response.status_code == 400
         assert "No servers specified" in response.json()["detail"]
     
-    @pytest.mark.asyncio
-    async def test_generate_config_unknown_servers(self, client: AsyncClient, mock_registry):
+    def test_generate_config_unknown_servers(self, sync_client: TestClient):
         """Test config generation with unknown servers (should skip them)"""
-        with patch("api.routers.config.get_server_registry", return_value=mock_registry), \
-             patch("api.routers.config.get_server_by_id", side_effect=lambda x: mock_registry.get(x)):
-            
-            response = await client.post("/api/v1/servers/generate-config", json={
-                "servers": ["github", "unknown-server", "filesystem"],
-                "format": "claude_desktop",
-                "include_env_vars": False
-            })
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            # Should only include known servers
-            assert len(data["config"]["mcpServers"]) == 2
-            assert "github" in data["config"]["mcpServers"]
-            assert "filesystem" in data["config"]["mcpServers"]
-            assert "unknown-server" not in data["config"]["mcpServers"]
+        response = sync_client.post("/api/v1/servers/generate-config", json={
+            "servers": ["github", "unknown-server", "filesystem"],
+            "format": "claude_desktop",
+            "include_env_vars": False
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        # Should only include known servers
+        assert len(data["config"]["mcpServers"]) == 2
+        assert "github" in data["config"]["mcpServers"]
+        assert "filesystem" in data["config"]["mcpServers"]
+        assert "unknown-server" not in data["config"]["mcpServers"]
     
-    @pytest.mark.asyncio
-    async def test_validate_config_valid(self, client: AsyncClient):
+    def test_validate_config_valid(self, sync_client: TestClient):
         """Test validation of valid configuration"""
         valid_config = {
             "command": "npx",
@@ -167,7 +153,7 @@ class TestConfigEndpoints:
             }
         }
         
-        response = await client.post("/api/v1/servers/validate-config", json={
+        response = sync_client.post("/api/v1/servers/validate-config", json={
             "config": valid_config
         })
         
@@ -178,15 +164,14 @@ class TestConfigEndpoints:
         assert len(data["errors"]) == 0
         assert data["config"] == valid_config
     
-    @pytest.mark.asyncio
-    async def test_validate_config_missing_command(self, client: AsyncClient):
+    def test_validate_config_missing_command(self, sync_client: TestClient):
         """Test validation with missing command field"""
         invalid_config = {
             "args": ["-y", "some-package"],
             "env": {}
         }
         
-        response = await client.post("/api/v1/servers/validate-config", json={
+        response = sync_client.post("/api/v1/servers/validate-config", json={
             "config": invalid_config
         })
         
@@ -196,15 +181,14 @@ class TestConfigEndpoints:
         assert data["valid"] is False
         assert "Missing required field: 'command'" in data["errors"]
     
-    @pytest.mark.asyncio
-    async def test_validate_config_unusual_command(self, client: AsyncClient):
+    def test_validate_config_unusual_command(self, sync_client: TestClient):
         """Test validation with unusual command (should generate warning)"""
         config_with_unusual_command = {
             "command": "unusual-command",
             "args": ["some", "args"]
         }
         
-        response = await client.post("/api/v1/servers/validate-config", json={
+        response = sync_client.post("/api/v1/servers/validate-config", json={
             "config": config_with_unusual_command
         })
         
@@ -215,15 +199,26 @@ class TestConfigEndpoints:
         assert len(data["errors"]) == 0
         assert "Unusual command: 'unusual-command'" in data["warnings"]
     
-    @pytest.mark.asyncio
-    async def test_validate_config_invalid_args(self, client: AsyncClient):
+    def test_validate_config_non_string_command(self, sync_client: TestClient):
+        """Test validation with a list command (should warn, not fail)"""
+        response = sync_client.post("/api/v1/servers/validate-config", json={
+            "config": {"command": ["npx", "-y"]}
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["valid"] is True
+        assert "Unusual command: '['npx', '-y']'" in data["warnings"]
+    
+    def test_validate_config_invalid_args(self, sync_client: TestClient):
         """Test validation with invalid args type"""
         invalid_config = {
             "command": "npx",
             "args": "should-be-array-not-string"
         }
         
-        response = await client.post("/api/v1/servers/validate-config", json={
+        response = sync_client.post("/api/v1/servers/validate-config", json={
             "config": invalid_config
         })
         
@@ -233,15 +228,14 @@ class TestConfigEndpoints:
         assert data["valid"] is False
         assert "Field 'args' must be an array" in data["errors"]
     
-    @pytest.mark.asyncio
-    async def test_validate_config_invalid_env_type(self, client: AsyncClient):
+    def test_validate_config_invalid_env_type(self, sync_client: TestClient):
         """Test validation with invalid env type"""
         invalid_config = {
             "command": "npx",
             "env": "should-be-object-not-string"
         }
         
-        response = await client.post("/api/v1/servers/validate-config", json={
+        response = sync_client.post("/api/v1/servers/validate-config", json={
             "config": invalid_config
         })
         
@@ -251,8 +245,7 @@ class TestConfigEndpoints:
         assert data["valid"] is False
         assert "Field 'env' must be an object" in data["errors"]
     
-    @pytest.mark.asyncio
-    async def test_validate_config_invalid_env_keys(self, client: AsyncClient):
+    def test_validate_config_invalid_env_keys(self, sync_client: TestClient):
         """Test validation with invalid environment variable keys"""
         invalid_config = {
             "command": "npx",
@@ -261,7 +254,7 @@ class TestConfigEndpoints:
             }
         }
         
-        response = await client.post("/api/v1/servers/validate-config", json={
+        response = sync_client.post("/api/v1/servers/validate-config", json={
             "config": invalid_config
         })
         
@@ -4,19 +4,8 @@ Tests for FastAPI main application
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch
 
-from api.main import app
-
-@pytest.fixture
-def client():
-    """Create test client"""
-    # Manually trigger startup to load registry
-    from api.dependencies import load_server_registry
-    load_server_registry()
-    return TestClient(app)
-
 @pytest.fixture
 def mock_registry():
     """Mock server registry for testing"""
@@ -70,9 +59,9 @@ def mock_registry():
 class TestMainEndpoints:
     """Test main application endpoints"""
     
-    def test_root_endpoint(self, client):
+    def test_root_endpoint(self, sync_client):
         """Test root endpoint"""
-        response = client.get("/")
+        response = sync_client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["name"] == "MCP Catalog API"
@@ -80,9 +69,9 @@ class TestMainEndpoints:
         assert "/docs" in data["docs"]
         assert "/openapi.json" in data["openapi"]
     
-    def test_health_endpoint(self, client):
+    def test_health_endpoint(self, sync_client):
         """Test health check endpoint"""
-        response = client.get("/health")
+        response = sync_client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
@@ -90,9 +79,9 @@ class TestMainEndpoints:
         assert "catalog_version" in data
         assert "api_version" in data
     
-    def test_openapi_json_generation(self, client):
+    def test_openapi_json_generation(self, sync_client):
         """Test that FastAPI auto-generates OpenAPI spec"""
-        response = client.get("/openapi.json")
+        response = sync_client.get("/openapi.json")
         assert response.status_code == 200
         data = response.json()
         assert data["openapi"] == "3.1.0"
@@ -105,18 +94,33 @@ class TestMainEndpoints:
         assert "/health" in paths
         assert "/api/v1/servers" in paths
     
-    def test_docs_available(self, client):
+    def test_docs_available(self, sync_client):
         """Test that interactive docs are available"""
-        response = client.get("/docs")
+        response = sync_client.get("/docs")
         assert response.status_code == 200
         assert "swagger" in response.text.lower()
 
 class TestCORS:
     """Test CORS configuration"""
     
-    def test_cors_headers_present(self, client):
+    def test_cors_headers_present(self, sync_client):
         """Test that CORS headers are present"""
         # Note: FastAPI TestClient doesn't expose CORS headers in tests
         # CORS functionality is tested in browser/integration tests
-        response = client.get("/health")
-        assert response.status_code == 200  # Basic functionality check
\ No newline at end of file
+        response = sync_client.get("/health")
+        assert response.status_code == 200  # Basic functionality check
+
+class TestRegistryLoading:
+    """Test lazy server registry loading"""
+    
+    def test_registry_loads_on_first_access(self, monkeypatch):
+        """Test that the registry is read from disk on first access only"""
+        import api.dependencies as dependencies
+        monkeypatch.setattr(dependencies, "_server_registry", None)
+        
+        registry = dependencies.get_server_registry()
+        assert isinstance(registry, dict)
+        assert len(registry) > 0
+        
+        # Subsequent calls reuse the loaded registry
+        assert dependencies.get_server_registry() is registry
@@ -3,19 +3,18 @@
 Test main FastAPI application endpoints and lifecycle
 """
 
-import pytest
+import asyncio
 from unittest.mock import patch
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 class TestMainApp:
     """Test main application endpoints"""
     
-    @pytest.mark.asyncio
-    async def test_root_endpoint(self, client: AsyncClient):
+    def test_root_endpoint(self, sync_client: TestClient):
         """Test root endpoint returns API information"""
-        response = await client.get("/")
+        response = sync_client.get("/")
         assert response.status_code == 200
         
         data = response.json()
@@ -25,8 +24,7 @@ class TestMainApp:
         assert data["docs"] == "/docs"
         assert data["openapi"] == "/openapi.json"
     
-    @pytest.mark.asyncio
-    async def test_health_check_endpoint(self, client: AsyncClient):
+    def test_health_check_endpoint(self, sync_client: TestClient):
         """Test health check endpoint"""
         mock_registry = {
             "github": {"name": "GitHub MCP"},
@@ -34,7 +32,7 @@ class TestMainApp:
         }
         
         with patch("api.dependencies.get_server_registry", return_value=mock_registry):
-            response = await client.get("/health")
+            response = sync_client.get("/health")
             assert response.status_code == 200
             
             data = response.json()
@@ -43,28 +41,25 @@ class TestMainApp:
             assert data["catalog_version"] == "1.0.0"
             assert data["api_version"] == "v1"
     
-    @pytest.mark.asyncio
-    async def test_health_check_empty_registry(self, client: AsyncClient):
+    def test_health_check_empty_registry(self, sync_client: TestClient):
         """Test health check with empty server registry"""
         with patch("api.dependencies.get_server_registry", return_value={}):
-            response = await client.get("/health")
+            response = sync_client.get("/health")
             assert response.status_code == 200
             
             data = response.json()
             assert data["status"] == "healthy"
             assert data["server_count"] == 0
     
-    @pytest.mark.asyncio
-    async def test_openapi_docs_accessible(self, client: AsyncClient):
+    def test_openapi_docs_accessible(self, sync_client: TestClient):
         """Test that OpenAPI documentation is accessible"""
-        response = await client.get("/docs")
+        response = sync_client.get("/docs")
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
     
-    @pytest.mark.asyncio
-    async def test_openapi_json_accessible(self, client: AsyncClient):
+    def test_openapi_json_accessible(self, sync_client: TestClient):
         """Test that OpenAPI JSON spec is accessible"""
-        response = await client.get("/openapi.json")
+        response = sync_client.get("/openapi.json")
         assert response.status_code == 200
         assert response.headers.get("content-type") == "application/json"
         
@@ -74,17 +69,15 @@ class TestMainApp:
         assert data["info"]["title"] == "MCP Catalog API"
         assert data["info"]["version"] == "1.0.0"
     
-    @pytest.mark.asyncio
-    async def test_redoc_accessible(self, client: AsyncClient):
+    def test_redoc_accessible(self, sync_client: TestClient):
         """Test that ReDoc documentation is accessible"""
-        response = await client.get("/redoc")
+        response = sync_client.get("/redoc")
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
     
-    @pytest.mark.asyncio
-    async def test_cors_headers_present(self, client: AsyncClient):
+    def test_cors_headers_present(self, sync_client: TestClient):
         """Test that CORS headers are present in responses"""
-        response = await client.get("/")
+        response = sync_client.get("/")
         assert response.status_code == 200
         
         # CORS headers should be present
@@ -93,26 +86,20 @@ class TestMainApp:
         # but we can test the response is successful
         assert response.status_code == 200
     
-    @pytest.mark.asyncio
-    async def test_404_for_unknown_endpoint(self, client: AsyncClient):
+    def test_404_for_unknown_endpoint(self, sync_client: TestClient):
         """Test 404 response for unknown endpoints"""
-        response = await client.get("/nonexistent-endpoint")
+        response = sync_client.get("/nonexistent-endpoint")
         assert response.status_code == 404
     
-    @pytest.mark.asyncio
     async def test_api_endpoints_have_v1_prefix(self, client: AsyncClient):
         """Test that API endpoints require /api/v1 prefix"""
         # These should return 404 without the prefix
-        response = await client.get("/servers")
-        assert response.status_code == 404
-        
-        response = await client.get("/categories")
-        assert response.status_code == 404
+        responses = await asyncio.gather(client.get("/servers"), client.get("/categories"))
+        assert [r.status_code for r in responses] == [404, 404]
         
         # But work with the prefix (assuming mock registry)
         with patch("api.routers.servers.get_server_registry", return_value={}):
-            response = await client.get("/api/v1/servers")
-            assert response.status_code == 200
-            
-            response = await client.get("/api/v1/categories")
-            assert response.status_code == 200
\ No newline at end of file
+            responses = await asyncio.gather(
+                client.get("/api/v1/servers"), client.get("/api/v1/categories")
+            )
+            assert [r.status_code for r in responses] == [200, 200]
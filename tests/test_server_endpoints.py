@@ -4,17 +4,17 @@ Test server endpoints not covered in other test files
 """
 
 import pytest
-from unittest.mock import patch
 from httpx import AsyncClient
 
+SEARCH_URL = "/api/v1/servers/search"
+
 
-@pytest.mark.asyncio
 class TestServerEndpoints:
     """Test server endpoints for better coverage"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def mock_registry(self):
-        """Mock server registry with test servers"""
+        """Mock server registry with test servers, built once per session"""
         return {
             "github": {
                 "id": "github",
@@ -63,193 +63,164 @@ class TestServerEndpoints:
             }
         }
     
-    @pytest.mark.asyncio
-    async def test_list_servers_success(self, client: AsyncClient, mock_registry):
+    @pytest.fixture(autouse=True)
+    def _patch_registry(self, monkeypatch, mock_registry):
+        """Serve the mock registry to the servers router for every test"""
+        monkeypatch.setattr("api.routers.servers.get_server_registry", lambda: mock_registry)
+        monkeypatch.setattr("api.routers.servers.get_server_by_id", mock_registry.get)
+    
+    async def test_list_servers_success(self, client: AsyncClient):
         """Test successful server listing"""
-        with patch("api.routers.servers.get_server_registry", return_value=mock_registry):
-            response = await client.get("/api/v1/servers")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["total"] == 3
-            assert len(data["servers"]) == 3
-            
-            # Check server details
-            github_server = next(s for s in data["servers"] if s["id"] == "github")
-            assert github_server["name"] == "GitHub MCP"
-            assert github_server["category"] == "development"
-            assert github_server["vendor"] == "Anthropic"
-            
-            # Check defaults for weather server
-            weather_server = next(s for s in data["servers"] if s["id"] == "weather")
-            assert weather_server["category"] == "data"  # from mock_registry
-            assert weather_server["vendor"] == "community"  # default
-            assert weather_server["homepage"] == ""  # default
+        response = await client.get("/api/v1/servers")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["total"] == 3
+        assert len(data["servers"]) == 3
+        
+        servers_by_id = {server["id"]: server for server in data["servers"]}
+        
+        # Check server details
+        github_server = servers_by_id["github"]
+        assert github_server["name"] == "GitHub MCP"
+        assert github_server["category"] == "development"
+        assert github_server["vendor"] == "Anthropic"
+        
+        # Check defaults for weather server
+        weather_server = servers_by_id["weather"]
+        assert weather_server["category"] == "data"  # from mock_registry
+        assert weather_server["vendor"] == "community"  # default
+        assert weather_server["homepage"] == ""  # default
     
-    @pytest.mark.asyncio
-    async def test_search_servers_by_query(self, client: AsyncClient, mock_registry):
+    @pytest.mark.parametrize("query,expected_id", [
+        ("GitHub", "github"),      # name
+        ("file", "filesystem"),    # description
+        ("weather", "weather"),    # ID
+    ])
+    async def test_search_servers_by_query(self, client: AsyncClient, query, expected_id):
         """Test server search by query"""
-        with patch("api.routers.servers.get_server_registry", return_value=mock_registry):
-            # Search by name
-            response = await client.get("/api/v1/servers/search?q=GitHub")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["total"] == 1
-            assert data["query"] == "GitHub"
-            assert data["results"][0]["id"] == "github"
-            
-            # Search by description
-            response = await client.get("/api/v1/servers/search?q=file")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["total"] == 1
-            assert data["results"][0]["id"] == "filesystem"
-            
-            # Search by ID
-            response = await client.get("/api/v1/servers/search?q=weather")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["total"] == 1
-            assert data["results"][0]["id"] == "weather"
+        response = await client.get(SEARCH_URL, params={"q": query})
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["total"] == 1
+        assert data["query"] == query
+        assert data["results"][0]["id"] == expected_id
     
-    @pytest.mark.asyncio
-    async def test_search_servers_by_category(self, client: AsyncClient, mock_registry):
+    async def test_search_servers_by_category(self, client: AsyncClient):
         """Test server search by category"""
-        with patch("api.routers.servers.get_server_registry", return_value=mock_registry):
-            response = await client.get("/api/v1/servers/search?category=development")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["total"] == 1
-            assert data["category"] == "development"
-            assert data["results"][0]["id"] == "github"
+        response = await client.get(SEARCH_URL, params={"category": "development"})
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["total"] == 1
+        assert data["category"] == "development"
+        assert data["results"][0]["id"] == "github"
     
-    @pytest.mark.asyncio
-    async def test_search_servers_query_and_category(self, client: AsyncClient, mock_registry):
+    @pytest.mark.parametrize("category,expected_total", [
+        ("development", 1),  # matches both query and category
+        ("utility", 0),      # wrong category
+    ])
+    async def test_search_servers_query_and_category(self, client: AsyncClient, category, expected_total):
         """Test server search with both query and category"""
-        with patch("api.routers.servers.get_server_registry", return_value=mock_registry):
-            # Should match both query and category
-            response = await client.get("/api/v1/servers/search?q=GitHub&category=development")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["total"] == 1
-            assert data["query"] == "GitHub"
-            assert data["category"] == "development"
+        response = await client.get(SEARCH_URL, params={"q": "GitHub", "category": category})
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["total"] == expected_total
+        assert data["query"] == "GitHub"
+        assert data["category"] == category
+        if expected_total:
             assert data["results"][0]["id"] == "github"
-            
-            # Should not match - wrong category
-            response = await client.get("/api/v1/servers/search?q=GitHub&category=utility")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["total"] == 0
     
-    @pytest.mark.asyncio
     async def test_search_servers_no_params(self, client: AsyncClient):
         """Test search with no query or category parameters"""
-        response = await client.get("/api/v1/servers/search")
+        response = await client.get(SEARCH_URL)
         assert response.status_code == 400
         assert "Query parameter 'q' or 'category' required" in response.json()["detail"]
     
-    @pytest.mark.asyncio
-    async def test_search_servers_case_insensitive(self, client: AsyncClient, mock_registry):
+    async def test_search_servers_case_insensitive(self, client: AsyncClient):
         """Test search is case insensitive"""
-        with patch("api.routers.servers.get_server_registry", return_value=mock_registry):
-            response = await client.get("/api/v1/servers/search?q=github")  # lowercase
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["total"] == 1
-            assert data["results"][0]["id"] == "github"
+        response = await client.get(SEARCH_URL, params={"q": "github"})  # lowercase
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["total"] == 1
+        assert data["results"][0]["id"] == "github"
     
-    @pytest.mark.asyncio
-    async def test_get_server_info_success(self, client: AsyncClient, mock_registry):
+    async def test_get_server_info_success(self, client: AsyncClient):
         """Test successful server info retrieval"""
-        with patch("api.routers.servers.get_server_by_id", side_effect=lambda x: mock_registry.get(x)):
-            response = await client.get("/api/v1/servers/github")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["id"] == "github"
-            assert data["name"] == "GitHub MCP"
-            assert data["description"] == "GitHub operations"
-            assert data["category"] == "development"
-            assert data["vendor"] == "Anthropic"
-            assert data["homepage"] == "https://github.com/anthropics/mcp-server-github"
-            assert data["license"] == "MIT"
-            assert "installation" in data
-            assert "config" in data
-            assert data["features"] == ["repository-management", "issue-tracking"]
-            assert data["supported_platforms"] == ["linux", "macos", "windows"]
-            assert "capabilities" in data
-            assert data["capabilities"]["tools"] is True
+        response = await client.get("/api/v1/servers/github")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["id"] == "github"
+        assert data["name"] == "GitHub MCP"
+        assert data["description"] == "GitHub operations"
+        assert data["category"] == "development"
+        assert data["vendor"] == "Anthropic"
+        assert data["homepage"] == "https://github.com/anthropics/mcp-server-github"
+        assert data["license"] == "MIT"
+        assert "installation" in data
+        assert "config" in data
+        assert data["features"] == ["repository-management", "issue-tracking"]
+        assert data["supported_platforms"] == ["linux", "macos", "windows"]
+        assert "capabilities" in data
+        assert data["capabilities"]["tools"] is True
     
-    @pytest.mark.asyncio
     async def test_get_server_info_not_found(self, client: AsyncClient):
         """Test server info for non-existent server"""
-        with patch("api.routers.servers.get_server_by_id", return_value=None):
-            response = await client.get("/api/v1/servers/nonexistent")
-            assert response.status_code == 404
-            assert "Server 'nonexistent' not found" in response.json()["detail"]
+        response = await client.get("/api/v1/servers/nonexistent")
+        assert response.status_code == 404
+        assert "Server 'nonexistent' not found" in response.json()["detail"]
     
-    @pytest.mark.asyncio
-    async def test_get_server_info_defaults(self, client: AsyncClient, mock_registry):
+    async def test_get_server_info_defaults(self, client: AsyncClient):
         """Test server info with default values"""
-        with patch("api.routers.servers.get_server_by_id", side_effect=lambda x: mock_registry.get(x)):
-            response = await client.get("/api/v1/servers/weather")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["id"] == "weather"
-            assert data["category"] == "data"  # from mock_registry, not default
-            assert data["vendor"] == "community"  # default
-            assert data["homepage"] == ""  # default
-            assert data["license"] == "Unknown"  # default
-            assert "installation" in data  # installation field is present
-            assert "config" in data  # config field is present
-            assert data["features"] == []  # default
-            assert data["supported_platforms"] == ["all"]  # default
-            # capabilities field should not exist if not in server config
+        response = await client.get("/api/v1/servers/weather")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["id"] == "weather"
+        assert data["category"] == "data"  # from mock_registry, not default
+        assert data["vendor"] == "community"  # default
+        assert data["homepage"] == ""  # default
+        assert data["license"] == "Unknown"  # default
+        assert "installation" in data  # installation field is present
+        assert "config" in data  # config field is present
+        assert data["features"] == []  # default
+        assert data["supported_platforms"] == ["all"]  # default
+        # capabilities field should not exist if not in server config
     
-    @pytest.mark.asyncio
-    async def test_list_categories_success(self, client: AsyncClient, mock_registry):
+    async def test_list_categories_success(self, client: AsyncClient):
         """Test successful category listing"""
-        with patch("api.routers.servers.get_server_registry", return_value=mock_registry):
-            response = await client.get("/api/v1/categories")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "categories" in data
-            
-            # Convert to dict for easier testing
-            categories = {cat["name"]: cat["count"] for cat in data["categories"]}
-            
-            assert categories["development"] == 1  # github
-            assert categories["utility"] == 1      # filesystem
-            assert categories["data"] == 1         # weather
-            
-    @pytest.mark.asyncio
-    async def test_list_categories_empty_registry(self, client: AsyncClient):
+        response = await client.get("/api/v1/categories")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert "categories" in data
+        
+        # Convert to dict for easier testing
+        categories = {cat["name"]: cat["count"] for cat in data["categories"]}
+        
+        assert categories["development"] == 1  # github
+        assert categories["utility"] == 1      # filesystem
+        assert categories["data"] == 1         # weather
+        
+    async def test_list_categories_empty_registry(self, client: AsyncClient, monkeypatch):
         """Test category listing with empty registry"""
-        with patch("api.routers.servers.get_server_registry", return_value={}):
-            response = await client.get("/api/v1/categories")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["categories"] == []
+        monkeypatch.setattr("api.routers.servers.get_server_registry", lambda: {})
+        response = await client.get("/api/v1/categories")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["categories"] == []
     
-    @pytest.mark.asyncio
-    async def test_search_servers_no_results(self, client: AsyncClient, mock_registry):
+    async def test_search_servers_no_results(self, client: AsyncClient):
         """Test search with no matching results"""
-        with patch("api.routers.servers.get_server_registry", return_value=mock_registry):
-            response = await client.get("/api/v1/servers/search?q=nonexistent")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["total"] == 0
-            assert data["results"] == []
-            assert data["query"] == "nonexistent"
\ No newline at end of file
+        response = await client.get(SEARCH_URL, params={"q": "nonexistent"})
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["total"] == 0
+        assert data["results"] == []
+        assert data["query"] == "nonexistent"
\ No newline at end of file
@@ -3,20 +3,14 @@
 Tests for servers router endpoints
 """
 
+import sys
+
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch
 
-from api.main import app
-
-@pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_registry():
-    """Mock server registry for testing"""
+    """Mock server registry for testing, built once per session"""
     return {
         "test_server": {
             "id": "test_server", 
@@ -40,22 +34,22 @@ class TestServerEndpoints:
     """Test server management endpoints"""
     
     @patch('api.routers.servers.get_server_registry')
-    def test_list_servers_empty(self, mock_get_registry, client):
+    def test_list_servers_empty(self, mock_get_registry, sync_client):
         """Test listing servers when registry is empty"""
         mock_get_registry.return_value = {}
         
-        response = client.get("/api/v1/servers")
+        response = sync_client.get("/api/v1/servers")
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 0
         assert data["servers"] == []
     
     @patch('api.routers.servers.get_server_registry')
-    def test_list_servers_with_data(self, mock_get_registry, client, mock_registry):
+    def test_list_servers_with_data(self, mock_get_registry, sync_client, mock_registry):
         """Test listing servers with mock data"""
         mock_get_registry.return_value = mock_registry
         
-        response = client.get("/api/v1/servers")
+        response = sync_client.get("/api/v1/servers")
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 2
@@ -70,11 +64,11 @@ class TestServerEndpoints:
         assert "vendor" in server
     
     @patch('api.routers.servers.get_server_by_id')
-    def test_get_server_info(self, mock_get_server, client, mock_registry):
+    def test_get_server_info(self, mock_get_server, sync_client, mock_registry):
         """Test getting specific server info"""
         mock_get_server.return_value = mock_registry["github"]
         
-        response = client.get("/api/v1/servers/github")
+        response = sync_client.get("/api/v1/servers/github")
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == "github"
@@ -82,21 +76,21 @@ class TestServerEndpoints:
         assert data["category"] == "development"
     
     @patch('api.routers.servers.get_server_by_id')
-    def test_get_server_info_not_found(self, mock_get_server, client):
+    def test_get_server_info_not_found(self, mock_get_server, sync_client):
         """Test getting info for non-existent server"""
         mock_get_server.return_value = None
         
-        response = client.get("/api/v1/servers/nonexistent")
+        response = sync_client.get("/api/v1/servers/nonexistent")
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"].lower()
     
     @patch('api.routers.servers.get_server_registry')
-    def test_search_servers_by_query(self, mock_get_registry, client, mock_registry):
+    def test_search_servers_by_query(self, mock_get_registry, sync_client, mock_registry):
         """Test server search by query"""
         mock_get_registry.return_value = mock_registry
         
-        response = client.get("/api/v1/servers/search?q=github")
+        response = sync_client.get("/api/v1/servers/search?q=github")
         assert response.status_code == 200
         data = response.json()
         assert data["query"] == "github"
@@ -104,29 +98,29 @@ class TestServerEndpoints:
         assert "results" in data
     
     @patch('api.routers.servers.get_server_registry')
-    def test_search_servers_by_category(self, mock_get_registry, client, mock_registry):
+    def test_search_servers_by_category(self, mock_get_registry, sync_client, mock_registry):
         """Test server search by category"""
         mock_get_registry.return_value = mock_registry
         
-        response = client.get("/api/v1/servers/search?category=development")
+        response = sync_client.get("/api/v1/servers/search?category=development")
         assert response.status_code == 200
         data = response.json()
         assert data["category"] == "development"
         assert "results" in data
     
-    def test_search_servers_no_params(self, client):
+    def test_search_servers_no_params(self, sync_client):
         """Test search without query or category fails"""
-        response = client.get("/api/v1/servers/search")
+        response = sync_client.get("/api/v1/servers/search")
         assert response.status_code == 400
         data = response.json()
         assert "required" in data["detail"].lower()
     
     @patch('api.routers.servers.get_server_registry')
-    def test_list_categories(self, mock_get_registry, client, mock_registry):
+    def test_list_categories(self, mock_get_registry, sync_client, mock_registry):
         """Test listing categories"""
         mock_get_registry.return_value = mock_registry
         
-        response = client.get("/api/v1/categories")
+        response = sync_client.get("/api/v1/categories")
         assert response.status_code == 200
         data = response.json()
         assert "categories" in data
@@ -138,4 +132,45 @@ class TestServerEndpoints:
         category = categories[0]
         assert "name" in category
         assert "count" in category
-        assert isinstance(category["count"], int)
\ No newline at end of file
+        assert isinstance(category["count"], int)
+
+class TestSubprocessManagerDiscovery:
+    """Test locating the engine's subprocess_manager module"""
+    
+    @pytest.fixture
+    def engine_root(self, tmp_path, monkeypatch):
+        """Empty engine checkout named by MCP_ENGINE_ROOT, with import state restored"""
+        monkeypatch.setenv("MCP_ENGINE_ROOT", str(tmp_path))
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        yield tmp_path
+        for name in ("subprocess_manager", "engine_helpers"):
+            sys.modules.pop(name, None)
+    
+    def test_loads_from_engine_root(self, engine_root):
+        """Test that the engine module and its sibling imports load"""
+        from api.routers.servers import _find_engine_subprocess_manager
+        (engine_root / "engine_helpers.py").write_text("MANAGER = 'engine manager'\n")
+        (engine_root / "subprocess_manager.py").write_text(
+            "import engine_helpers\n"
+            "\n"
+            "def get_subprocess_manager():\n"
+            "    return engine_helpers.MANAGER\n"
+        )
+        
+        get_subprocess_manager = _find_engine_subprocess_manager()
+        
+        assert get_subprocess_manager() == "engine manager"
+        assert "subprocess_manager" in sys.modules
+    
+    @pytest.mark.parametrize("source", [
+        pytest.param(None, id="missing-module"),
+        pytest.param("import engine_helpers\n", id="failing-import"),
+        pytest.param("MANAGER = None\n", id="no-get-subprocess-manager"),
+    ])
+    def test_unloadable_engine_falls_back(self, engine_root, source):
+        """Test that an engine module that can't be loaded yields None"""
+        from api.routers.servers import _find_engine_subprocess_manager
+        if source is not None:
+            (engine_root / "subprocess_manager.py").write_text(source)
+        
+        assert _find_engine_subprocess_manager() is None
@@ -3,310 +3,302 @@
 Test /servers/tools endpoint with different MCP transport types
 """
 
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+import httpx
 from httpx import AsyncClient
 import json
+from types import MappingProxyType
 
 from api.models.servers import ServerTool
 
 
-@pytest.mark.asyncio
-class TestServersToolsTransports:
-    """Test /servers/tools endpoint with various transport types"""
-    
-    @pytest.fixture
-    def mock_registry(self):
-        """Mock server registry with various transport configurations"""
-        return {
-            # HTTP server with explicit endpoint
-            "weather-api": {
-                "id": "weather-api",
-                "name": "Weather API",
-                "description": "Weather data via HTTP",
-                "mcp_endpoint": "https://weather.example.com/mcp",
-                "transport": "http",
-                "package": {
-                    "name": "weather-api-mcp",
-                    "registry": "npm"
-                },
-                "config": {
-                    "env": {},
-                    "args": []
-                }
-            },
-            # SSE server
-            "live-data": {
-                "id": "live-data",
-                "name": "Live Data Stream", 
-                "description": "Real-time data via SSE",
-                "mcp_endpoint": "https://stream.example.com/sse",
-                "transport": "sse",
-                "package": {
-                    "name": "live-data-mcp",
-                    "registry": "npm"
-                },
-                "config": {
-                    "env": {},
-                    "args": []
-                }
+# Read-only mock registry with various transport configurations
+_MOCK_REGISTRY = MappingProxyType({
+    # HTTP server with explicit endpoint
+    "weather-api": {
+        "id": "weather-api",
+        "name": "Weather API",
+        "description": "Weather data via HTTP",
+        "mcp_endpoint": "https://weather.example.com/mcp",
+        "transport": "http",
+        "package": {
+            "name": "weather-api-mcp",
+            "registry": "npm"
+        },
+        "config": {
+            "env": {},
+            "args": []
+        }
+    },
+    # SSE server
+    "live-data": {
+        "id": "live-data",
+        "name": "Live Data Stream", 
+        "description": "Real-time data via SSE",
+        "mcp_endpoint": "https://stream.example.com/sse",
+        "transport": "sse",
+        "package": {
+            "name": "live-data-mcp",
+            "registry": "npm"
+        },
+        "config": {
+            "env": {},
+            "args": []
+        }
+    },
+    # NPX server (stdio)
+    "github": {
+        "id": "github",
+        "name": "GitHub MCP",
+        "description": "GitHub operations via NPX",
+        "package": {
+            "name": "@modelcontextprotocol/server-github",
+            "registry": "npm"
+        },
+        "config": {
+            "env": {
+                "GITHUB_PERSONAL_ACCESS_TOKEN": {"required": True}
             },
-            # NPX server (stdio)
-            "github": {
-                "id": "github",
-                "name": "GitHub MCP",
-                "description": "GitHub operations via NPX",
-                "package": {
-                    "name": "@modelcontextprotocol/server-github",
-                    "registry": "npm"
-                },
-                "config": {
-                    "env": {
-                        "GITHUB_PERSONAL_ACCESS_TOKEN": {"required": True}
-                    },
-                    "args": []
+            "args": []
+        }
+    },
+    # Python server (stdio)
+    "filesystem": {
+        "id": "filesystem",
+        "name": "Filesystem MCP",
+        "description": "File operations via Python",
+        "package": {
+            "name": "@modelcontextprotocol/server-filesystem",
+            "registry": "npm"
+        },
+        "config": {
+            "env": {},
+            "args": []
+        }
+    }
+})
+
+
+# Tools each mock server reports, by server id
+_TRANSPORT_TOOLS = {
+    "weather-api": [
+        {
+            "name": "get_weather",
+            "description": "Get weather for a city",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "city": {"type": "string"}
                 }
-            },
-            # Python server (stdio)
-            "filesystem": {
-                "id": "filesystem",
-                "name": "Filesystem MCP",
-                "description": "File operations via Python",
-                "package": {
-                    "name": "@modelcontextprotocol/server-filesystem",
-                    "registry": "npm"
-                },
-                "config": {
-                    "env": {},
-                    "args": []
+            }
+        },
+        {
+            "name": "get_forecast",
+            "description": "Get weather forecast",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "city": {"type": "string"},
+                    "days": {"type": "integer"}
                 }
             }
         }
+    ],
+    "live-data": [
+        {"name": "subscribe_updates", "description": "Subscribe to live updates"}
+    ],
+    "github": [
+        {"name": "create_issue", "description": "Create GitHub issue"},
+        {"name": "list_repos", "description": "List repositories"}
+    ],
+    "filesystem": [
+        {"name": "read_file", "description": "Read file contents"},
+        {"name": "write_file", "description": "Write to file"},
+        {"name": "list_directory", "description": "List directory"}
+    ]
+}
+
+# Encoded list_tools replies for the HTTP and SSE servers, by endpoint host
+_HTTP_TOOL_BODIES = {
+    httpx.URL(config["mcp_endpoint"]).host: json.dumps({"tools": _TRANSPORT_TOOLS[server_id]}).encode()
+    for server_id, config in _MOCK_REGISTRY.items()
+    if "mcp_endpoint" in config
+}
+
+
+class _StubSubprocessManager:
+    """Minimal stand-in for the engine's subprocess manager"""
     
-    @pytest.mark.asyncio
-    async def test_http_server_tools(self, client: AsyncClient, mock_registry):
-        """Test querying tools from HTTP MCP servers"""
-        with patch("api.routers.servers.get_server_registry", 
-                   return_value=mock_registry):
-            
-            # Mock successful HTTP response
-            mock_http_response = {
-                "tools": [
-                    {
-                        "name": "get_weather",
-                        "description": "Get weather for a city",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "city": {"type": "string"}
-                            }
-                        }
-                    },
-                    {
-                        "name": "get_forecast",
-                        "description": "Get weather forecast",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "city": {"type": "string"},
-                                "days": {"type": "integer"}
-                            }
-                        }
-                    }
-                ]
-            }
-            
-            with patch("httpx.AsyncClient.post", 
-                       return_value=AsyncMock(status_code=200, 
-                                             json=lambda: mock_http_response)):
-                
-                response = await client.get("/api/v1/servers/tools")
-                assert response.status_code == 200
-                
-                data = response.json()
-                
-                # Find weather-api server
-                weather_server = next((s for s in data["servers"] if s["id"] == "weather-api"), None)
-                assert weather_server is not None, f"weather-api server not found in {[s['id'] for s in data['servers']]}"
-                assert weather_server["tool_count"] == 2
-                assert len(weather_server["tools"]) == 2
-                assert weather_server["tools"][0]["name"] == "get_weather"
+    def __init__(self, list_tools, started=True):
+        self._list_tools = list_tools
+        self._started = started
+        self.processes = {}
+        self.cleaned_up = False
     
-    @pytest.mark.asyncio
-    async def test_sse_server_tools(self, client: AsyncClient, mock_registry):
-        """Test querying tools from SSE MCP servers"""
-        with patch("api.routers.servers.get_server_registry", 
-                   return_value=mock_registry):
-            
-            # Mock SSE response
-            mock_sse_response = {
-                "tools": [
-                    {
-                        "name": "subscribe_updates",
-                        "description": "Subscribe to live updates"
-                    }
-                ]
-            }
-            
-            with patch("httpx.AsyncClient.post",
-                       return_value=AsyncMock(status_code=200,
-                                             json=lambda: mock_sse_response)):
-                
-                response = await client.get("/api/v1/servers/tools")
-                assert response.status_code == 200
-                
-                data = response.json()
-                
-                # Find live-data server
-                live_server = next(s for s in data["servers"] if s["id"] == "live-data")
-                assert live_server["tool_count"] == 1
-                assert live_server["tools"][0]["name"] == "subscribe_updates"
+    async def start_server(self, server_name, config):
+        return self._started
     
-    @pytest.mark.asyncio
-    async def test_stdio_server_tools(self, client: AsyncClient, mock_registry):
-        """Test querying tools from stdio-based MCP servers"""
-        with patch("api.routers.servers.get_server_registry", 
-                   return_value=mock_registry):
-            
-            # Mock subprocess manager for stdio servers
-            mock_subprocess_manager = MagicMock()
-            
-            # Mock different tool responses for each server type
-            tool_responses = {
-                "github": {
-                    "tools": [
-                        {"name": "create_issue", "description": "Create GitHub issue"},
-                        {"name": "list_repos", "description": "List repositories"}
-                    ]
-                },
-                "filesystem": {
-                    "tools": [
-                        {"name": "read_file", "description": "Read file contents"},
-                        {"name": "write_file", "description": "Write to file"},
-                        {"name": "list_directory", "description": "List directory"}
-                    ]
-                },
-                "database": {
-                    "tools": [
-                        {"name": "query", "description": "Execute SQL query"},
-                        {"name": "list_tables", "description": "List database tables"}
-                    ]
-                },
-                "analyzer": {
-                    "tools": [
-                        {"name": "analyze_code", "description": "Analyze code quality"}
-                    ]
-                }
-            }
-            
-            async def mock_list_tools(server_name):
-                return tool_responses.get(server_name, {"tools": []})
-            
-            async def mock_start_server(server_name, config):
-                return True
-            
-            mock_subprocess_manager.list_tools = AsyncMock(side_effect=mock_list_tools)
-            mock_subprocess_manager.start_server = AsyncMock(side_effect=mock_start_server)
-            mock_subprocess_manager.cleanup = AsyncMock()
-            mock_subprocess_manager.processes = {}
-            
-            with patch("api.routers.servers.get_subprocess_manager",
-                       return_value=mock_subprocess_manager):
-                
-                response = await client.get("/api/v1/servers/tools")
-                assert response.status_code == 200
-                
-                data = response.json()
-                assert data["total_servers"] >= 4  # At least our stdio servers
-                
-                # Check each stdio server
-                for server_id, expected_tools in tool_responses.items():
-                    server = next((s for s in data["servers"] if s["id"] == server_id), None)
-                    if server:  # Server might be filtered by env vars
-                        assert server["tool_count"] == len(expected_tools["tools"])
-                        assert len(server["tools"]) == server["tool_count"]
+    async def list_tools(self, server_name):
+        return self._list_tools(server_name)
+    
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+class TestServersToolsTransports:
+    """Test /servers/tools endpoint with various transport types"""
+    
+    @pytest.fixture(scope="session")
+    def mock_registry(self):
+        """Mock server registry with various transport configurations"""
+        return _MOCK_REGISTRY
+    
+    @pytest.fixture(autouse=True)
+    def _patch_registry(self, monkeypatch, mock_registry):
+        """Serve the mock registry to the servers router for every test"""
+        monkeypatch.setattr("api.routers.servers.get_server_registry", lambda: mock_registry)
+    
+    @pytest.mark.parametrize("server_id, expected_tools", [
+        pytest.param("weather-api", ["get_weather", "get_forecast"], id="http"),
+        pytest.param("live-data", ["subscribe_updates"], id="sse"),
+        pytest.param("github", ["create_issue", "list_repos"], id="stdio-npx"),
+        pytest.param("filesystem", ["read_file", "write_file", "list_directory"], id="stdio-python"),
+    ])
+    async def test_transport_tools(self, client: AsyncClient, monkeypatch, mock_mcp_http,
+                                   server_id, expected_tools):
+        """Test querying tools from HTTP, SSE and stdio MCP servers"""
+        # HTTP and SSE servers are told apart by host, stdio servers by name
+        mock_mcp_http(lambda request: httpx.Response(200, content=_HTTP_TOOL_BODIES[request.url.host]))
+        
+        mock_subprocess_manager = _StubSubprocessManager(
+            lambda server_name: {"tools": _TRANSPORT_TOOLS.get(server_name, [])})
+        # Already running, so the endpoint skips the startup wait
+        mock_subprocess_manager.processes = dict.fromkeys(("github", "filesystem"))
+        monkeypatch.setattr("api.routers.servers.get_subprocess_manager", lambda: mock_subprocess_manager)
+        
+        response = await client.get("/api/v1/servers/tools")
+        assert response.status_code == 200
+        
+        data = response.json()
+        servers_by_id = {server["id"]: server for server in data["servers"]}
+        
+        server = servers_by_id.get(server_id)
+        assert server is not None, f"{server_id} server not found in {list(servers_by_id)}"
+        assert server["tool_count"] == len(expected_tools)
+        assert [tool["name"] for tool in server["tools"]] == expected_tools
     
-    @pytest.mark.asyncio
-    async def test_mixed_transport_types(self, client: AsyncClient, mock_registry):
+    async def test_mixed_transport_types(self, client: AsyncClient, monkeypatch, mock_registry, mock_mcp_http):
         """Test endpoint handles mixed transport types correctly"""
-        with patch("api.routers.servers.get_server_registry", 
-                   return_value=mock_registry):
-            
-            # Mock both HTTP and subprocess responses
-            mock_http_response = {
-                "tools": [{"name": "http_tool", "description": "HTTP tool"}]
-            }
-            
-            mock_subprocess_manager = MagicMock()
-            async def mock_list_tools(server_name):
-                return {"tools": [{"name": f"{server_name}_tool", "description": f"{server_name} tool"}]}
-            
-            mock_subprocess_manager.list_tools = AsyncMock(side_effect=mock_list_tools)
-            mock_subprocess_manager.start_server = AsyncMock(return_value=True)
-            mock_subprocess_manager.cleanup = AsyncMock()
-            mock_subprocess_manager.processes = {}
-            
-            with patch("httpx.AsyncClient.post",
-                       return_value=AsyncMock(status_code=200,
-                                             json=lambda: mock_http_response)), \
-                 patch("api.routers.servers.get_subprocess_manager",
-                       return_value=mock_subprocess_manager):
-                
-                response = await client.get("/api/v1/servers/tools")
-                assert response.status_code == 200
-                
-                data = response.json()
-                assert data["total_servers"] == len(mock_registry)
-                
-                # Verify we got tools from both HTTP and stdio servers
-                http_servers = [s for s in data["servers"] 
-                               if s["id"] in ["weather-api", "live-data"]]
-                stdio_servers = [s for s in data["servers"] 
-                                if s["id"] in ["github", "filesystem", "database", "analyzer"]]
-                
-                assert len(http_servers) >= 1
-                assert len(stdio_servers) >= 1
-                
-                # All servers should have at least one tool
-                for server in data["servers"]:
-                    assert server["tool_count"] >= 1
+        # Mock both HTTP and subprocess responses
+        mock_http_response = {
+            "tools": [{"name": "http_tool", "description": "HTTP tool"}]
+        }
+        
+        mock_subprocess_manager = _StubSubprocessManager(
+            lambda server_name: {"tools": [{"name": f"{server_name}_tool", "description": f"{server_name} tool"}]})
+        
+        body = json.dumps(mock_http_response).encode()
+        mock_mcp_http(lambda request: httpx.Response(200, content=body))
+        
+        monkeypatch.setattr("api.routers.servers.get_subprocess_manager", lambda: mock_subprocess_manager)
+        
+        response = await client.get("/api/v1/servers/tools")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["total_servers"] == len(mock_registry)
+        
+        # Verify we got tools from both HTTP and stdio servers
+        http_servers = [s for s in data["servers"] 
+                       if s["id"] in ["weather-api", "live-data"]]
+        stdio_servers = [s for s in data["servers"] 
+                        if s["id"] in ["github", "filesystem", "database", "analyzer"]]
+        
+        assert len(http_servers) >= 1
+        assert len(stdio_servers) >= 1
+        
+        # All servers should have at least one tool
+        for server in data["servers"]:
+            assert server["tool_count"] >= 1
     
-    @pytest.mark.asyncio
-    async def test_server_connection_failures(self, client: AsyncClient, mock_registry):
+    async def test_server_connection_failures(self, client: AsyncClient, monkeypatch, mock_registry, mock_mcp_http):
         """Test handling of connection failures for different transport types"""
-        with patch("api.routers.servers.get_server_registry", 
-                   return_value=mock_registry):
+        # Mock HTTP connection failure
+        def refuse(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+        
+        mock_mcp_http(refuse)
+        
+        # Mock subprocess manager that also fails
+        mock_subprocess_manager = _StubSubprocessManager(
+            lambda server_name: {"error": "Failed to start server"}, started=False)
+        
+        monkeypatch.setattr("api.routers.servers.get_subprocess_manager", lambda: mock_subprocess_manager)
+        
+        response = await client.get("/api/v1/servers/tools")
+        assert response.status_code == 200
+        
+        data = response.json()
+        
+        # All servers should be present but with 0 tools
+        assert data["total_servers"] == len(mock_registry)
+        assert data["total_tools"] == 0
+        
+        for server in data["servers"]:
+            assert server["tool_count"] == 0
+            assert len(server["tools"]) == 0
+    
+    async def test_servers_queried_concurrently(self, client: AsyncClient, monkeypatch, mock_registry, mock_mcp_http):
+        """Test that servers are queried concurrently rather than one at a time"""
+        stdio_ids = {"github", "filesystem"}
+        arrived = set()
+        all_arrived = asyncio.Event()
+        
+        class _BarrierSubprocessManager(_StubSubprocessManager):
+            """Only answers once every stdio server has been asked"""
             
-            # Mock HTTP connection failure
-            with patch("httpx.AsyncClient.post",
-                       side_effect=Exception("Connection refused")):
-                
-                # Mock subprocess manager that also fails
-                mock_subprocess_manager = MagicMock()
-                mock_subprocess_manager.list_tools = AsyncMock(
-                    return_value={"error": "Failed to start server"})
-                mock_subprocess_manager.start_server = AsyncMock(return_value=False)
-                mock_subprocess_manager.cleanup = AsyncMock()
-                mock_subprocess_manager.processes = {}
-                
-                with patch("api.routers.servers.get_subprocess_manager",
-                          return_value=mock_subprocess_manager):
-                    
-                    response = await client.get("/api/v1/servers/tools")
-                    assert response.status_code == 200
-                    
-                    data = response.json()
-                    
-                    # All servers should be present but with 0 tools
-                    assert data["total_servers"] == len(mock_registry)
-                    assert data["total_tools"] == 0
-                    
-                    for server in data["servers"]:
-                        assert server["tool_count"] == 0
-                        assert len(server["tools"]) == 0
+            async def list_tools(self, server_name):
+                arrived.add(server_name)
+                if arrived == stdio_ids:
+                    all_arrived.set()
+                # A serial endpoint would time out here on the first server
+                await asyncio.wait_for(all_arrived.wait(), timeout=1.0)
+                return {"tools": [{"name": f"{server_name}_tool"}]}
+        
+        mock_subprocess_manager = _BarrierSubprocessManager(None)
+        mock_subprocess_manager.processes = dict.fromkeys(stdio_ids)
+        mock_mcp_http(lambda request: httpx.Response(200, content=b'{"tools": []}'))
+        
+        monkeypatch.setattr("api.routers.servers.get_subprocess_manager", lambda: mock_subprocess_manager)
+        
+        response = await client.get("/api/v1/servers/tools")
+        assert response.status_code == 200
+        servers_by_id = {server["id"]: server for server in response.json()["servers"]}
+        for server_id in stdio_ids:
+            assert servers_by_id[server_id]["tool_count"] == 1
+    
+    async def test_bad_registry_entry_isolated(self, client: AsyncClient, monkeypatch, mock_mcp_http):
+        """Test that one malformed server entry doesn't fail the whole listing"""
+        mock_registry = {
+            "weather-api": _MOCK_REGISTRY["weather-api"],
+            "broken": {"name": "Broken Server", "mcp_endpoint": 12345}
+        }
+        monkeypatch.setattr("api.routers.servers.get_server_registry", lambda: mock_registry)
+        mock_mcp_http(lambda request: httpx.Response(200, content=_HTTP_TOOL_BODIES[request.url.host]))
+        
+        mock_subprocess_manager = _StubSubprocessManager(lambda server_name: {"tools": []})
+        monkeypatch.setattr("api.routers.servers.get_subprocess_manager", lambda: mock_subprocess_manager)
+        
+        response = await client.get("/api/v1/servers/tools")
+        assert response.status_code == 200
+        
+        servers_by_id = {server["id"]: server for server in response.json()["servers"]}
+        assert servers_by_id["broken"]["tool_count"] == 0
+        assert servers_by_id["weather-api"]["tool_count"] == 2
+        assert mock_subprocess_manager.cleaned_up
     
-    @pytest.mark.asyncio
-    async def test_websocket_transport(self, client: AsyncClient):
+    async def test_websocket_transport(self, client: AsyncClient, monkeypatch, mock_mcp_http):
         """Test handling WebSocket transport (future support)"""
         mock_registry = {
             "realtime": {
@@ -316,49 +308,50 @@ class TestServersToolsTransports:
                 "transport": "websocket"
             }
         }
+        monkeypatch.setattr("api.routers.servers.get_server_registry", lambda: mock_registry)
         
-        with patch("api.routers.servers.get_server_registry", 
-                   return_value=mock_registry):
-            
-            response = await client.get("/api/v1/servers/tools")
-            assert response.status_code == 200
-            
-            data = response.json()
-            
-            # WebSocket servers should be included but may have 0 tools
-            # (not implemented yet)
-            ws_server = next(s for s in data["servers"] if s["id"] == "realtime")
-            assert ws_server["name"] == "Realtime Server"
-            assert ws_server["tool_count"] == 0  # Not implemented yet
+        # Keep the test hermetic; WebSocket endpoints are not queried over HTTP
+        def refuse(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+        
+        mock_mcp_http(refuse)
+        
+        response = await client.get("/api/v1/servers/tools")
+        assert response.status_code == 200
+        
+        data = response.json()
+        
+        # WebSocket servers should be included but may have 0 tools
+        # (not implemented yet)
+        servers_by_id = {server["id"]: server for server in data["servers"]}
+        ws_server = servers_by_id["realtime"]
+        assert ws_server["name"] == "Realtime Server"
+        assert ws_server["tool_count"] == 0  # Not implemented yet
     
-    @pytest.mark.asyncio
-    async def test_environment_variable_requirements(self, client: AsyncClient, mock_registry):
+    async def test_environment_variable_requirements(self, client: AsyncClient, monkeypatch, mock_registry,
+                                                     mock_mcp_http):
         """Test servers with missing environment variables return empty tools"""
-        with patch("api.routers.servers.get_server_registry", 
-                   return_value=mock_registry):
-            
-            # Mock subprocess manager
-            mock_subprocess_manager = MagicMock()
-            mock_subprocess_manager.list_tools = AsyncMock(
-                return_value={"error": "Missing environment variables"})
-            mock_subprocess_manager.start_server = AsyncMock(return_value=False)
-            mock_subprocess_manager.cleanup = AsyncMock()
-            mock_subprocess_manager.processes = {}
-            
-            # Remove required env vars
-            with patch.dict("os.environ", {}, clear=True), \
-                 patch("api.routers.servers.get_subprocess_manager",
-                       return_value=mock_subprocess_manager):
-                
-                response = await client.get("/api/v1/servers/tools")
-                assert response.status_code == 200
-                
-                data = response.json()
-                
-                # GitHub server requires GITHUB_PERSONAL_ACCESS_TOKEN
-                github_server = next(s for s in data["servers"] if s["id"] == "github")
-                assert github_server["tool_count"] == 0
-                
-                # Filesystem server should have 0 tools (no env vars required, but no mocked tools)
-                filesystem_server = next(s for s in data["servers"] if s["id"] == "filesystem")
-                assert filesystem_server["tool_count"] == 0
\ No newline at end of file
+        # The HTTP and SSE servers in the registry are answered locally
+        mock_mcp_http(lambda request: httpx.Response(200, content=_HTTP_TOOL_BODIES[request.url.host]))
+        
+        # Mock subprocess manager
+        mock_subprocess_manager = _StubSubprocessManager(
+            lambda server_name: {"error": "Missing environment variables"}, started=False)
+        
+        # Remove required env vars
+        monkeypatch.delenv("GITHUB_PERSONAL_ACCESS_TOKEN", raising=False)
+        monkeypatch.setattr("api.routers.servers.get_subprocess_manager", lambda: mock_subprocess_manager)
+        
+        response = await client.get("/api/v1/servers/tools")
+        assert response.status_code == 200
+        
+        data = response.json()
+        servers_by_id = {server["id"]: server for server in data["servers"]}
+        
+        # GitHub server requires GITHUB_PERSONAL_ACCESS_TOKEN
+        github_server = servers_by_id["github"]
+        assert github_server["tool_count"] == 0
+        
+        # Filesystem server should have 0 tools (no env vars required, but no mocked tools)
+        filesystem_server = servers_by_id["filesystem"]
+        assert filesystem_server["tool_count"] == 0
\ No newline at end of file
@@ -8,39 +8,42 @@ This MCP server was generated from traffic-captured OpenAPI spec - language agno
 """
 
 import os
-import json
+import re
+from functools import cache
+from pathlib import Path
 import httpx
 from fastmcp import FastMCP
 from fastmcp.server.openapi import RouteMap, MCPType
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Load the OpenAPI specification
 OPENAPI_SPEC_FILE = "workspace/captured-openapi.json"
 
+@cache
 def load_openapi_spec():
-    """Load OpenAPI spec from file or API"""
-    if os.path.exists(OPENAPI_SPEC_FILE):
-        with open(OPENAPI_SPEC_FILE, 'r') as f:
-            return json.load(f)
-    else:
+    """Load OpenAPI spec from file or API, once per process"""
+    try:
+        return json_loads(Path(OPENAPI_SPEC_FILE).read_bytes())
+    except FileNotFoundError:
         # Fallback to fetching from API
         response = httpx.get("http://localhost:8000/openapi.json")
         return response.json()
 
-# Load OpenAPI spec
-openapi_spec = load_openapi_spec()
+# REST API the generated server proxies to
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 
-# Create HTTP client for the REST API
-client = httpx.AsyncClient(
-    base_url=os.getenv("API_BASE_URL", "http://localhost:8000"),
-    timeout=30.0
-)
+# Route patterns, compiled once and handed to RouteMap as Pattern objects
+LIST_PATTERN = re.compile(r".*/(servers|categories|items|list)$")
+PATH_PARAM_PATTERN = re.compile(r".*/{[^}]+}.*")
+SEARCH_PATTERN = re.compile(r".*/search.*")
+ANY_PATTERN = re.compile(r".*")
+HEALTH_PATTERN = re.compile(r".*/health.*")
 
-# Create FastMCP server from captured OpenAPI
-mcp = FastMCP.from_openapi(
-    openapi_spec=openapi_spec,
-    client=client,
-    name="Generated MCP Server",
-    instructions=f"""
+INSTRUCTIONS = """
     Generated MCP Server from Traffic Capture
     
     Original API: Untitled service
@@ -50,49 +53,73 @@ mcp = FastMCP.from_openapi(
     All functionality is automatically inferred from real traffic patterns.
     
     Language-agnostic generation - works with APIs built in any language!
-    """,
-    route_maps=[
-        # GET endpoints that list data become Resources
-        RouteMap(
-            methods=["GET"], 
-            pattern=r".*/(servers|categories|items|list)$", 
-            mcp_type=MCPType.RESOURCE,
-            mcp_tags={"catalog", "list"}
-        ),
-        
-        # GET endpoints with path parameters become ResourceTemplates
-        RouteMap(
-            methods=["GET"], 
-            pattern=r".*/{[^}]+}.*", 
-            mcp_type=MCPType.RESOURCE_TEMPLATE,
-            mcp_tags={"catalog", "detail"}
-        ),
-        
-        # GET endpoints with query parameters become Tools
-        RouteMap(
-            methods=["GET"],
-            pattern=r".*/search.*",
-            mcp_type=MCPType.TOOL,
-            mcp_tags={"catalog", "search"}
-        ),
-        
-        # All POST/PUT/PATCH/DELETE endpoints become Tools
-        RouteMap(
-            methods=["POST", "PUT", "PATCH", "DELETE"], 
-            pattern=r".*", 
-            mcp_type=MCPType.TOOL,
-            mcp_tags={"api", "action"}
-        ),
-        
-        # Health checks are Resources
-        RouteMap(
-            methods=["GET"],
-            pattern=r".*/health.*",
-            mcp_type=MCPType.RESOURCE,
-            mcp_tags={"system", "health"}
-        )
-    ]
-)
+    """
+
+ROUTE_MAPS = [
+    # GET endpoints that list data become Resources
+    RouteMap(
+        methods=["GET"], 
+        pattern=LIST_PATTERN, 
+        mcp_type=MCPType.RESOURCE,
+        mcp_tags={"catalog", "list"}
+    ),
+    
+    # GET endpoints with path parameters become ResourceTemplates
+    RouteMap(
+        methods=["GET"], 
+        pattern=PATH_PARAM_PATTERN, 
+        mcp_type=MCPType.RESOURCE_TEMPLATE,
+        mcp_tags={"catalog", "detail"}
+    ),
+    
+    # GET endpoints with query parameters become Tools
+    RouteMap(
+        methods=["GET"],
+        pattern=SEARCH_PATTERN,
+        mcp_type=MCPType.TOOL,
+        mcp_tags={"catalog", "search"}
+    ),
+    
+    # All POST/PUT/PATCH/DELETE endpoints become Tools
+    RouteMap(
+        methods=["POST", "PUT", "PATCH", "DELETE"], 
+        pattern=ANY_PATTERN, 
+        mcp_type=MCPType.TOOL,
+        mcp_tags={"api", "action"}
+    ),
+    
+    # Health checks are Resources
+    RouteMap(
+        methods=["GET"],
+        pattern=HEALTH_PATTERN,
+        mcp_type=MCPType.RESOURCE,
+        mcp_tags={"system", "health"}
+    )
+]
+
+def create_server() -> FastMCP:
+    """Build the FastMCP server from the captured OpenAPI spec"""
+    # Create HTTP client for the REST API
+    client = httpx.AsyncClient(base_url=API_BASE_URL, timeout=30.0)
+    
+    return FastMCP.from_openapi(
+        openapi_spec=load_openapi_spec(),
+        client=client,
+        name="Generated MCP Server",
+        instructions=INSTRUCTIONS,
+        route_maps=ROUTE_MAPS
+    )
+
+@cache
+def _default_server() -> FastMCP:
+    """Build the server once for attribute access"""
+    return create_server()
+
+def __getattr__(name: str):
+    """Build `mcp` on first access, so `fastmcp run <this file>` still finds the server"""
+    if name == "mcp":
+        return _default_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     import argparse
@@ -105,11 +132,13 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    mcp = create_server()
+    
     if args.transport == "http":
         print(f"🚀 Starting generated MCP server on http://localhost:{args.port}/mcp")
-        print(f"📡 Proxying to API: {client.base_url}")
+        print(f"📡 Proxying to API: {API_BASE_URL}")
         mcp.run(transport="http", port=args.port)
     else:
         print("📡 Starting generated MCP server with stdio transport")
-        print(f"📡 Proxying to API: {client.base_url}")
+        print(f"📡 Proxying to API: {API_BASE_URL}")
         mcp.run(transport="stdio")